@@ -2,7 +2,6 @@ import base64
 import gzip
 import os
 import re
-import urllib.parse
 import urllib.request
 from collections.abc import Mapping
 from typing import BinaryIO, Optional
@@ -35,6 +34,9 @@ def _expand_env_vars(credential: str, url: str, env: Optional[Mapping[str, str]]
     It only supports the following forms: `${ENV_VAR}`.
     Neither `$ENV_VAR` or `%ENV_VAR` are supported.
     """
+    if "${" not in credential:
+        return credential
+
     if env is None:
         env = os.environ
 
@@ -45,7 +47,7 @@ def _expand_env_vars(credential: str, url: str, env: Optional[Mapping[str, str]]
             log.warning("Environment variable '%s' is not set, but is used in inventory URL %s", match.group(1), url)
             return match.group(0)
 
-    return re.sub(ENV_VAR_PATTERN, replace_func, credential)
+    return ENV_VAR_PATTERN.sub(replace_func, credential)
 
 
 # Implementation adapted from PDM: https://github.com/pdm-project/pdm.
@@ -54,12 +56,18 @@ def _extract_auth_from_url(url: str) -> tuple[str, dict[str, str]]:
     if "@" not in url:
         return url, {}
 
-    scheme, netloc, *rest = urllib.parse.urlparse(url)
-    auth, host = netloc.split("@", 1)
+    # Plain string operations are enough to isolate the network location: no need to parse the whole URL.
+    scheme, sep, rest = url.partition("://")
+    netloc_end = min((index for index in map(rest.find, "/?#") if index != -1), default=len(rest))
+    auth, at, host = rest[:netloc_end].partition("@")
+    if not (sep and at):
+        # The `@` is part of the path, query or fragment, not of the network location.
+        return url, {}
+
     auth = _expand_env_vars(credential=auth, url=url)
     auth_header = _create_auth_header(credential=auth, url=url)
 
-    url = urllib.parse.urlunparse((scheme, host, *rest))
+    url = f"{scheme}{sep}{host}{rest[netloc_end:]}"
     return url, auth_header
 
 
@@ -71,7 +79,7 @@ def _create_auth_header(credential: str, url: str) -> dict[str, str]:
         return {"Authorization": f"Bearer {credential}"}
 
     # Else, we assume that the user is using user:password.
-    user, pwd = credential.split(":", 1)
     log.debug("Using basic authentication for %s", url)
-    credentials = base64.encodebytes(f"{user}:{pwd}".encode()).decode().strip()
+    # Unlike `encodebytes`, `b64encode` doesn't insert newlines every 76 characters.
+    credentials = base64.b64encode(credential.encode()).decode()
     return {"Authorization": f"Basic {credentials}"}
@@ -78,7 +78,6 @@ class AutoDocProcessor(BlockProcessor):
         self.md = md
         self._handlers = handlers
         self._autorefs = autorefs
-        self._updated_envs: set = set()
 
     def test(self, parent: Element, block: str) -> bool:  # noqa: ARG002
         """Match our autodoc instructions.
@@ -90,7 +89,8 @@ class AutoDocProcessor(BlockProcessor):
         Returns:
             Whether this block should be processed or not.
         """
-        return bool(self.regex.search(block))
+        # This is called on most blocks of every page: cheaply reject blocks without the marker first.
+        return ":::" in block and bool(self.regex.search(block))
 
     def run(self, parent: Element, blocks: MutableSequence[str]) -> None:
         """Run code on the matched blocks.
@@ -190,10 +190,10 @@ class AutoDocProcessor(BlockProcessor):
             log.error("%s", exception)  # noqa: TRY400
             raise PluginError(f"Could not collect '{identifier}'") from exception
 
-        if handler_name not in self._updated_envs:  # We haven't seen this handler before on this document.
-            log.debug("Updating handler's rendering env")
-            handler._update_env(self.md, config=self._handlers._tool_config)
-            self._updated_envs.add(handler_name)
+        # Handlers' Markdown instances outlive pages (and this processor can be the one of a handler's
+        # inner Markdown instance, rendering nested blocks): always propagate the current page's state.
+        log.debug("Updating handler's rendering env")
+        handler._update_env(self.md, config=self._handlers._tool_config)
 
         log.debug("Rendering templates")
         try:
@@ -315,10 +315,13 @@ class _TocLabelsTreeProcessor(Treeprocessor):
         self._override_toc_labels(self.md.toc_tokens)  # type: ignore[attr-defined]
 
     def _override_toc_labels(self, tokens: list[dict[str, Any]]) -> None:
-        for token in tokens:
+        # Explicit stack rather than recursion: order doesn't matter since each token is updated independently.
+        stack = list(tokens)
+        while stack:
+            token = stack.pop()
             if (label := token.get("data-toc-label")) and token["name"] != label:
                 token["name"] = label
-            self._override_toc_labels(token["children"])
+            stack.extend(token["children"])
 
 
 class MkdocstringsExtension(Extension):
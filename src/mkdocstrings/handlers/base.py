@@ -510,7 +510,25 @@ class BaseHandler:
         warn("No need to call `super().update_env()` anymore.", DeprecationWarning, stacklevel=2)
 
     def _update_env(self, md: Markdown, *, config: Any | None = None) -> None:
-        """Update our handler to point to our configured Markdown instance, grabbing some of the config from `md`."""
+        """Update our handler to point to our configured Markdown instance, grabbing some of the config from `md`.
+
+        The Markdown instance and the Jinja environment are set up only once per handler:
+        building a Markdown instance (loading and registering all extensions) is costly,
+        and the configuration cannot change during a build. Only page-specific state,
+        i.e. MkDocs' `relpath` processor, is updated on subsequent calls.
+        """
+        if self._md is None:
+            self._setup_md(config)
+
+        # MkDocs adds its own (required) extension that's not part of the config. Propagate it.
+        # It is specific to the page being rendered, so it must be replaced for each page.
+        if "relpath" in md.treeprocessors:
+            self.md.treeprocessors.register(md.treeprocessors["relpath"], "relpath", priority=0)
+        elif "relpath" in self.md.treeprocessors:
+            self.md.treeprocessors.deregister("relpath")
+
+    def _setup_md(self, config: Any | None = None) -> None:
+        """Create our Markdown instance and finish setting up the Jinja environment."""
         # YORE: Bump 1: Remove block.
         if self.mdx is None and config is not None:
             self.mdx = config.get("mdx", None) or config.get("markdown_extensions", None) or ()
@@ -521,10 +539,6 @@ class BaseHandler:
 
         new_md = Markdown(extensions=extensions, extension_configs=self.mdx_config)
 
-        # MkDocs adds its own (required) extension that's not part of the config. Propagate it.
-        if "relpath" in md.treeprocessors:
-            new_md.treeprocessors.register(md.treeprocessors["relpath"], "relpath", priority=0)
-
         self._md = new_md
 
         self.env.filters["highlight"] = Highlighter(new_md).highlight
@@ -5,6 +5,7 @@ from __future__ import annotations
 import copy
 import re
 import textwrap
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from markdown.extensions import Extension
@@ -83,6 +84,8 @@ class Highlighter(Highlight):
                 config["language_prefix"] = config["lang_prefix"]
         self._css_class = config.pop("css_class", "highlight")
         super().__init__(**{name: opt for name, opt in config.items() if name in self._highlight_config_keys})
+        # The same short inline snippets (annotations, default values, etc.) are highlighted many times across pages.
+        self._highlight_cached = lru_cache(maxsize=1024)(self._highlight)
 
     def highlight(
         self,
@@ -113,6 +116,25 @@ class Highlighter(Highlight):
             src = textwrap.dedent(src)
 
         kwargs.setdefault("css_class", self._css_class)
+        if not inline:
+            # Code blocks (like source listings) are large and usually highlighted once: don't keep them around.
+            return self._highlight(src, language, inline=False, linenums=linenums, **kwargs)
+        try:
+            hash(tuple(kwargs.values()))
+        except TypeError:
+            # Unhashable options can't be used as cache keys.
+            return self._highlight(src, language, inline=True, linenums=linenums, **kwargs)
+        return self._highlight_cached(src, language, inline=True, linenums=linenums, **kwargs)
+
+    def _highlight(
+        self,
+        src: str,
+        language: str | None,
+        *,
+        inline: bool,
+        linenums: bool | None,
+        **kwargs: Any,
+    ) -> str:
         old_linenums = self.linenums  # type: ignore[has-type]
         if linenums is not None:
             self.linenums = linenums
@@ -220,7 +242,8 @@ class _HeadingReportingTreeprocessor(Treeprocessor):
     """Records the heading elements encountered in the document."""
 
     name = "mkdocstrings_headings_list"
-    regex = re.compile(r"[Hh][1-6]")
+    tags = frozenset(f"{h}{level}" for h in "Hh" for level in range(1, 7))
+    """The tag names of the heading elements to record."""
 
     headings: list[Element]
     """The list (the one passed in the initializer) that is used to record the heading elements (by appending to it)."""
@@ -232,7 +255,7 @@ class _HeadingReportingTreeprocessor(Treeprocessor):
     def run(self, root: Element) -> None:
         permalink_class = self.md.treeprocessors["toc"].permalink_class  # type: ignore[attr-defined]
         for el in root.iter():
-            if self.regex.fullmatch(el.tag):
+            if el.tag in self.tags:
                 el = copy.copy(el)  # noqa: PLW2901
                 # 'toc' extension's first pass (which we require to build heading stubs/ids) also edits the HTML.
                 # Undo the permalink edit so we can pass this heading to the outer pass of the 'toc' extension.
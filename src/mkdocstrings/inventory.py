@@ -6,7 +6,9 @@
 from __future__ import annotations
 
 import re
+import sys
 import zlib
+from operator import attrgetter
 from textwrap import dedent
 from typing import TYPE_CHECKING, BinaryIO
 
@@ -37,8 +39,9 @@ class InventoryItem:
             dispname: The item display name.
         """
         self.name: str = name
-        self.domain: str = domain
-        self.role: str = role
+        # Only a handful of distinct domains and roles exist: share the strings between items.
+        self.domain: str = sys.intern(str(domain))
+        self.role: str = sys.intern(str(role))
         self.uri: str = uri
         self.priority: int = priority
         self.dispname: str = dispname or name
@@ -140,7 +143,7 @@ class Inventory(dict):
 
         lines = [
             item.format_sphinx().encode("utf8")
-            for item in sorted(self.values(), key=lambda item: (item.domain, item.name))
+            for item in sorted(self.values(), key=attrgetter("domain", "name"))
         ]
         return header + zlib.compress(b"\n".join(lines) + b"\n", 9)
 
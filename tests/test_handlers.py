@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 from textwrap import dedent
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from jinja2.exceptions import TemplateNotFound
 from markdown import Markdown
+from markdown.treeprocessors import Treeprocessor
+from pymdownx.highlight import Highlight
 
 from mkdocstrings.handlers.base import Highlighter
 
@@ -54,6 +56,31 @@ def test_highlighter_basic(extension_name: str | None, inline: bool) -> None:
     assert "import foo" not in actual  # Highlighting has split it up.
 
 
+def test_highlighter_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Assert that inline highlighting results are cached, but not code blocks.
+
+    Parameters:
+        monkeypatch: Pytest fixture to patch objects.
+    """
+    calls = []
+    original_highlight = Highlight.highlight
+
+    def highlight(self: Highlight, src: str, *args: Any, **kwargs: Any) -> Any:
+        calls.append(src)
+        return original_highlight(self, src, *args, **kwargs)
+
+    monkeypatch.setattr(Highlight, "highlight", highlight)
+    hl = Highlighter(Markdown(extensions=["pymdownx.highlight"]))
+
+    first = hl.highlight("foo: int", language="python", inline=True)
+    assert hl.highlight("foo: int", language="python", inline=True) == first
+    assert calls == ["foo: int"]
+
+    hl.highlight("import foo", language="python")
+    hl.highlight("import foo", language="python")
+    assert calls == ["foo: int", "import foo", "import foo"]
+
+
 def test_extended_templates(tmp_path: Path, plugin: MkdocstringsPlugin) -> None:
     """Test the extended templates functionality.
 
@@ -135,3 +162,41 @@ def test_nested_autodoc(ext_markdown: Markdown) -> None:
             ],
         },
     ]
+
+
+def test_reusing_markdown_instance(plugin: MkdocstringsPlugin, ext_markdown: Markdown) -> None:
+    """Assert that the handler's Markdown instance is created once, then reused for each page.
+
+    Parameters:
+        plugin: Instance of our plugin.
+        ext_markdown: Markdown instance with our extension.
+    """
+    handler = plugin._handlers.get_handler("python")  # type: ignore[union-attr]
+    tool_config = plugin._handlers._tool_config  # type: ignore[union-attr]
+
+    handler._update_env(ext_markdown, config=tool_config)
+    inner_md = handler.md
+    handler._update_env(ext_markdown, config=tool_config)
+    assert handler.md is inner_md
+
+
+def test_updating_relpath_processor(plugin: MkdocstringsPlugin) -> None:
+    """Assert that MkDocs' page-specific `relpath` processor is swapped on each update of the reused Markdown instance.
+
+    Parameters:
+        plugin: Instance of our plugin.
+    """
+    handler = plugin._handlers.get_handler("python")  # type: ignore[union-attr]
+    tool_config = plugin._handlers._tool_config  # type: ignore[union-attr]
+
+    page_a_md = Markdown()
+    page_a_md.treeprocessors.register(Treeprocessor(page_a_md), "relpath", priority=0)
+    page_b_md = Markdown()
+    page_b_md.treeprocessors.register(Treeprocessor(page_b_md), "relpath", priority=0)
+
+    handler._update_env(page_a_md, config=tool_config)
+    assert handler.md.treeprocessors["relpath"] is page_a_md.treeprocessors["relpath"]
+    handler._update_env(page_b_md, config=tool_config)
+    assert handler.md.treeprocessors["relpath"] is page_b_md.treeprocessors["relpath"]
+    handler._update_env(Markdown(), config=tool_config)
+    assert "relpath" not in handler.md.treeprocessors
@@ -23,6 +23,7 @@ sphinx = pytest.importorskip("sphinx.util.inventory", reason="Sphinx is not inst
         Inventory([InventoryItem(name="object_path", domain="py", role="obj", uri="page_url#object_path")]),
         Inventory([InventoryItem(name="object_path", domain="py", role="obj", uri="page_url#other_anchor")]),
     ],
+    ids=["empty", "plain", "anchored", "other_anchor"],
 )
 def test_sphinx_load_inventory_file(our_inv: Inventory) -> None:
     """Perform the 'live' inventory load test."""